@@ -4,11 +4,23 @@ import moe
 def create_path_template_func():
     return [bucket]
 
-def bucket(artist):
-    first_char = artist[0]
+def _bucket(first_char):
     if first_char.isalpha():
         return first_char.upper()
     elif first_char.isnumeric():
         return "0-9"
     else:
         return "#-!"
+
+ascii_buckets = tuple(_bucket(chr(code)) for code in range(128))
+
+def bucket(artist):
+    if not artist:
+        return "#-!"
+
+    first_char = artist[0]
+    code = ord(first_char)
+    if code < 128:
+        return ascii_buckets[code]
+    else:
+        return _bucket(first_char)
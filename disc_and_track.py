@@ -5,11 +5,9 @@ def create_path_template_func():
     return [disc_dir_padded]
 
 def disc_dir_padded(track, album):
-    if album.disc_total == 1:
+    disc_total = album.disc_total
+    if disc_total <= 1:
         return ""
-    elif 2 <= album.disc_total <= 9:
-        return f"Disc {track.disc:1d}"
-    elif 10 <= album.disc_total <= 99:
-        return f"Disc {track.disc:02d}"
-    elif 101 <= album.disc_total <= 999:
-        return f"Disc {track.disc:03d}"
+
+    width = len(str(disc_total))
+    return f"Disc {track.disc:0{width}d}"
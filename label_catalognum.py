@@ -5,11 +5,13 @@ def create_path_template_func():
     return [label_catalognum]
 
 def label_catalognum(album):
-    if album.label and album.catalog_num:
-        return f" {{{album.label} {album.catalog_num}}}"
-    elif album.label:
-        return f" {{{album.label}}}"
-    elif album.catalog_num:
-        return f" {{{album.catalog_num}}}"
+    label = album.label
+    catalog_num = album.catalog_num
+    if label and catalog_num:
+        return f" {{{label} {catalog_num}}}"
+    elif label:
+        return f" {{{label}}}"
+    elif catalog_num:
+        return f" {{{catalog_num}}}"
     else:
         return ""
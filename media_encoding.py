@@ -15,27 +15,26 @@ media_subs = {
 }
 
 def standardized_album_media(album):
-    if album.media and album.media.lower() in media_subs:
-        return media_subs[album.media.lower()]
+    media = album.media
+    if media:
+        return media_subs.get(media.lower(), media)
     else:
-        return album.media
+        return media
 
 def album_audio_format(album):
-    audio_formats = [track.audio_format for track in album.tracks]
-    audio_formats = list(set(audio_formats))
-
-    if len(audio_formats) == 1:
-        return f"{audio_formats[0].upper()}"
+    tracks = album.tracks
+    if tracks and all(track.audio_format == tracks[0].audio_format for track in tracks):
+        return f"{tracks[0].audio_format.upper()}"
     else:
+        audio_formats = sorted({track.audio_format for track in tracks})
         return "+".join(map(str, audio_formats))
 
 def album_bit_depth(album):
-    bit_depths = [track.bit_depth for track in album.tracks]
-    bit_depths = list(set(bit_depths))
-
-    if len(bit_depths) == 1:
-        return f"{bit_depths[0]}bit"
+    tracks = album.tracks
+    if tracks and all(track.bit_depth == tracks[0].bit_depth for track in tracks):
+        return f"{tracks[0].bit_depth}bit"
     else:
+        bit_depths = sorted({track.bit_depth for track in tracks})
         return "+".join(map(str, bit_depths)) + "bit"
 
 def pretty_sample_rate(f_Hz):
@@ -46,13 +45,12 @@ def pretty_sample_rate(f_Hz):
         return str(f_kHz)
 
 def album_sample_rate(album):
-    sample_rates = [track.sample_rate for track in album.tracks]
-    sample_rates = list(set(sample_rates))
-
-    if len(sample_rates) == 1:
-        return f"{pretty_sample_rate(sample_rates[0])}kHz"
+    tracks = album.tracks
+    if tracks and all(track.sample_rate == tracks[0].sample_rate for track in tracks):
+        return f"{pretty_sample_rate(tracks[0].sample_rate)}kHz"
     else:
-        return "+".join(map(pretty_sample_rate, bit_depths)) + "kHz"
+        sample_rates = sorted({track.sample_rate for track in tracks})
+        return "+".join(map(pretty_sample_rate, sample_rates)) + "kHz"
 
 def media_encoding(album):
     media = standardized_album_media(album)
@@ -1,40 +1,48 @@
+import logging
 import re
 import moe
 
 from pathlib import Path
 
-import traceback
+log = logging.getLogger("moe.organize_extras")
 
 @moe.hookimpl
 def create_path_template_func():
     return [organize_extras]
 
+cover_pattern = re.compile(r"^(cover|folder)\.(jpg|jpeg|png)$", re.IGNORECASE)
+cue_log_extensions = (".cue", ".log")
+artwork_folder_pattern = re.compile(r"^(scan|scans|artwork)$", re.IGNORECASE)
+disc_num_pattern = re.compile(r"disc\s*(\d+)", re.IGNORECASE)
+
+def _artwork_index(parts):
+    for i, part in enumerate(parts):
+        if artwork_folder_pattern.match(part):
+            return i
+    return None
+
 def _organize_extras(extra):
     album = extra.album
-
-    # Define patterns
-    cover_pattern = re.compile(r"^(cover|folder)\.(jpg|jpeg|png)$", re.IGNORECASE)
-    cue_log_pattern = re.compile(r"^.*\.(cue|log)$", re.IGNORECASE)
-    artwork_folder_pattern = re.compile(r"^(scan|scans|artwork)$", re.IGNORECASE)
+    parts = extra.path.parts
+    artwork_index = _artwork_index(parts)
 
     if cover_pattern.match(extra.path.name):
         ext = extra.path.suffix
         return f"{album.title}{ext}"
 
-    elif any(artwork_folder_pattern.match(part) for part in extra.path.parts):
+    elif artwork_index is not None:
         # Preserve the folder structure from the matching folder onwards
-        artwork_index = next(i for i, part in enumerate(extra.path.parts) if artwork_folder_pattern.match(part))
-        preserved_path = Path(*extra.path.parts[artwork_index:])
+        preserved_path = Path(*parts[artwork_index:])
         return str(preserved_path)
 
-    elif cue_log_pattern.match(extra.path.name):
+    elif extra.path.name.lower().endswith(cue_log_extensions):
         ext = extra.path.suffix
 
         if album.disc_total == 1:
             return f"{album.title}{ext}"
         else:
             # Try to determine the disc number from the file path
-            disc_match = re.search(r"disc\s*(\d+)", str(extra.path).lower())
+            disc_match = disc_num_pattern.search(str(extra.path))
             if disc_match:
                 disc_num = disc_match.group(1)
             else:
@@ -48,7 +56,6 @@ def _organize_extras(extra):
         return extra.path.name
 
 def organize_extras(extra):
-    traceback.print_stack()
     new_path = _organize_extras(extra)
-    print(f"Processing extra: {extra.path} -> {new_path}")
+    log.debug(f"Processing extra: {extra.path} -> {new_path}")
     return new_path
@@ -4,9 +4,13 @@ import moe
 def create_path_template_func():
     return [the]
 
-articles = ["the", "a", "an"]
+articles = frozenset(["the", "a", "an"])
+article_prefixes = tuple(articles)
 
 def the(name):
+    if not name.lstrip()[:3].lower().startswith(article_prefixes):
+        return name
+
     name_split = name.split()
     first_word = name_split[0]
     if first_word.lower() in articles:
@@ -5,7 +5,9 @@ def create_path_template_func():
     return [year_reissue]
 
 def year_reissue(album):
-    if album.year == album.original_year:
-        return f"{album.year}"
+    year = album.year
+    original_year = album.original_year
+    if year == original_year:
+        return f"{year}"
     else:
-        return f"{album.original_year}, RE-{album.year}"
+        return f"{original_year}, RE-{year}"